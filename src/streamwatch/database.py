@@ -138,6 +138,8 @@ class StreamDatabase:
 
         Args:
             db_path: Path to SQLite database file. If None, uses default location.
+                Pass ":memory:" for a private in-memory database (one per thread,
+                since connections are thread-local).
         """
         if db_path is None:
             db_path = self._get_default_db_path()
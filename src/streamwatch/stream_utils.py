@@ -23,7 +23,8 @@ def parse_url_metadata(url: str) -> Dict[str, str]:
 
     try:
         parsed_uri = urlparse(url)
-        netloc = parsed_uri.netloc.replace("www.", "")
+        # Hostnames are case-insensitive; normalise before matching platforms
+        netloc = parsed_uri.netloc.lower().replace("www.", "")
         path = parsed_uri.path
     except ValueError:
         return _result("Unknown", "unknown_stream", "parse_error")
@@ -0,0 +1,41 @@
+"""Opt-in benchmarks guarding the scaling of hot helpers.
+
+Skipped by default (see ``pytest_configure`` in tests/conftest.py) and not
+collected at all without pytest-benchmark. Run them with
+``pytest tests/benchmarks --benchmark-only``.
+"""
+
+from src.streamwatch import stream_checker
+from src.streamwatch.result import Result, collect_results
+from src.streamwatch.stream_checker import MetadataResult, StreamCheckResult
+
+_OK_RESULTS = [Result.Ok(i) for i in range(10_000)]
+_STREAMS = [
+    {"url": f"https://www.twitch.tv/bench_{i}", "alias": f"Bench {i}"}
+    for i in range(1_000)
+]
+
+
+def test_collect_results_bench(benchmark):
+    """collect_results over 10k Ok results."""
+    collected = benchmark(collect_results, _OK_RESULTS)
+    assert len(collected.unwrap()) == len(_OK_RESULTS)
+
+
+def test_fetch_live_streams_bench(benchmark, monkeypatch, sample_stream_metadata_json):
+    """fetch_live_streams over 1k streams with streamlink stubbed out."""
+    monkeypatch.setattr(
+        stream_checker,
+        "is_stream_live_for_check_detailed",
+        lambda url: StreamCheckResult(is_live=True, url=url),
+    )
+    monkeypatch.setattr(
+        stream_checker,
+        "get_stream_metadata_json_detailed",
+        lambda url: MetadataResult(
+            success=True, url=url, json_data=sample_stream_metadata_json
+        ),
+    )
+
+    live_streams = benchmark(stream_checker.fetch_live_streams, _STREAMS)
+    assert len(live_streams) == len(_STREAMS)
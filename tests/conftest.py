@@ -2,9 +2,11 @@
 Common test fixtures and configuration for StreamWatch CLI tests.
 """
 
+import copy
 import json
-import tempfile
-from pathlib import Path
+import logging
+import subprocess
+from types import MappingProxyType, SimpleNamespace
 from typing import Any, Dict, List
 from unittest.mock import Mock, patch
 
@@ -12,35 +14,63 @@ import pytest
 
 
 @pytest.fixture
-def temp_config_dir():
-    """Create a temporary directory for config files during tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_config_dir(tmp_path):
+    """Create a temporary directory for config files during tests.
 
+    An alias of ``tmp_path``; fixtures in this file use ``tmp_path`` directly.
+    """
+    return tmp_path
 
-@pytest.fixture
+
+_SAMPLE_STREAM_DATA = (
+    MappingProxyType(
+        {"url": "https://www.twitch.tv/testuser1", "alias": "Test User 1"}
+    ),
+    MappingProxyType(
+        {"url": "https://www.youtube.com/@testchannel", "alias": "Test Channel"}
+    ),
+    MappingProxyType(
+        {"url": "https://www.twitch.tv/testuser2", "alias": "Test User 2"}
+    ),
+)
+
+# streams.json contents for the samples above, serialized once at import.
+_SAMPLE_STREAMS_JSON = json.dumps(
+    [dict(stream) for stream in _SAMPLE_STREAM_DATA], indent=2
+).encode("utf-8")
+
+
+@pytest.fixture(scope="module")
 def sample_stream_data() -> List[Dict[str, str]]:
-    """Sample stream data for testing."""
-    return [
-        {"url": "https://www.twitch.tv/testuser1", "alias": "Test User 1"},
-        {"url": "https://www.youtube.com/@testchannel", "alias": "Test Channel"},
-        {"url": "https://www.twitch.tv/testuser2", "alias": "Test User 2"},
-    ]
+    """Sample stream data for testing, copied from read-only templates per module.
+
+    Tests that need to modify the data should copy it, e.g. ``dict(stream)``.
+    """
+    return [dict(stream) for stream in _SAMPLE_STREAM_DATA]
+
+
+_SAMPLE_STREAM_METADATA = {
+    "metadata": {
+        "title": "Test Stream Title",
+        "author": "Test Author",
+        "game": "Test Game",
+        "viewers": 1234,
+        "user_name": "testuser",
+        "category": "Gaming",
+    }
+}
 
 
 @pytest.fixture
 def sample_stream_metadata() -> Dict[str, Any]:
     """Sample stream metadata for testing."""
-    return {
-        "metadata": {
-            "title": "Test Stream Title",
-            "author": "Test Author",
-            "game": "Test Game",
-            "viewers": 1234,
-            "user_name": "testuser",
-            "category": "Gaming",
-        }
-    }
+    return copy.deepcopy(_SAMPLE_STREAM_METADATA)
+
+
+@pytest.fixture(scope="session")
+def sample_stream_metadata_json() -> str:
+    """The sample metadata as ``streamlink --json`` output, serialized once."""
+    return json.dumps(_SAMPLE_STREAM_METADATA)
 
 
 @pytest.fixture
@@ -54,7 +84,7 @@ def mock_streamlink_process():
 
 
 @pytest.fixture
-def mock_config_file(temp_config_dir):
+def mock_config_file(tmp_path):
     """Create a mock config file for testing."""
     config_content = """
 [Streamlink]
@@ -70,34 +100,102 @@ args = --no-terminal --force-window=immediate
 pre_playback =
 post_playback =
 """
-    config_file = temp_config_dir / "config.ini"
+    config_file = tmp_path / "config.ini"
     config_file.write_text(config_content)
     return config_file
 
 
 @pytest.fixture
-def mock_streams_file(temp_config_dir, sample_stream_data):
+def mock_streams_file(tmp_path):
     """Create a mock streams.json file for testing."""
-    streams_file = temp_config_dir / "streams.json"
-    with open(streams_file, "w") as f:
-        json.dump(sample_stream_data, f, indent=2)
+    streams_file = tmp_path / "streams.json"
+    streams_file.write_bytes(_SAMPLE_STREAMS_JSON)
     return streams_file
 
 
 @pytest.fixture
 def mock_subprocess_run():
     """Mock subprocess.run for testing external commands."""
-    with patch("subprocess.run") as mock_run:
+    with patch.object(subprocess, "run") as mock_run:
         yield mock_run
 
 
 @pytest.fixture
 def mock_subprocess_popen():
     """Mock subprocess.Popen for testing background processes."""
-    with patch("subprocess.Popen") as mock_popen:
+    with patch.object(subprocess, "Popen") as mock_popen:
         yield mock_popen
 
 
+@pytest.fixture(scope="session")
+def _subprocess_mock_templates():
+    """``Popen``/``run`` mocks built once and reset for each test that uses them."""
+    return SimpleNamespace(Popen=Mock(), run=Mock())
+
+
+@pytest.fixture
+def fake_subprocess(monkeypatch, _subprocess_mock_templates):
+    """Swap the player module's ``subprocess`` reference for a fake namespace.
+
+    A single attribute swap replaces per-test ``@patch`` decorators on
+    ``player.subprocess.Popen``/``player.subprocess.run``. Constants and
+    exception types the player relies on are carried over from the real module.
+    """
+    from src.streamwatch import player
+
+    for template in (_subprocess_mock_templates.Popen, _subprocess_mock_templates.run):
+        template.reset_mock(return_value=True, side_effect=True)
+    fake = SimpleNamespace(
+        Popen=_subprocess_mock_templates.Popen,
+        run=_subprocess_mock_templates.run,
+        DEVNULL=subprocess.DEVNULL,
+        TimeoutExpired=subprocess.TimeoutExpired,
+    )
+    monkeypatch.setattr(player, "subprocess", fake)
+    return fake
+
+
+# What the stream checker's stubbed ``subprocess.run`` returns when a test has
+# not scripted it: a streamlink run that found nothing.
+_STREAMLINK_NO_STREAMS = subprocess.CompletedProcess(
+    args=[], returncode=1, stdout="", stderr="No streams found"
+)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _stub_stream_checker_subprocess():
+    """Keep the stream checker from ever launching streamlink.
+
+    The module's ``subprocess`` reference is swapped once per session for a
+    namespace whose ``run`` is a mock; tests script it via
+    ``stream_checker_run``. The real module is untouched, so other code that
+    calls ``subprocess.run`` is unaffected.
+    """
+    from src.streamwatch import stream_checker
+
+    fake = SimpleNamespace(
+        run=Mock(return_value=_STREAMLINK_NO_STREAMS),
+        CompletedProcess=subprocess.CompletedProcess,
+        TimeoutExpired=subprocess.TimeoutExpired,
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(stream_checker, "subprocess", fake)
+        yield fake
+
+
+@pytest.fixture(autouse=True)
+def stream_checker_run(_stub_stream_checker_subprocess):
+    """The stream checker's stubbed ``subprocess.run``, reset for every test.
+
+    Autouse so that a ``return_value`` or ``side_effect`` scripted by one test
+    never reaches a later test that calls the checker indirectly.
+    """
+    run = _stub_stream_checker_subprocess.run
+    run.reset_mock(return_value=True, side_effect=True)
+    run.return_value = _STREAMLINK_NO_STREAMS
+    return run
+
+
 @pytest.fixture
 def sample_url_metadata() -> List[Dict[str, str]]:
     """Sample URL metadata for testing URL parsing."""
@@ -123,10 +221,8 @@ def sample_url_metadata() -> List[Dict[str, str]]:
     ]
 
 
-@pytest.fixture
-def mock_live_stream_info() -> List[Dict[str, Any]]:
-    """Sample live stream info for testing."""
-    return [
+_LIVE_STREAM_INFO = (
+    MappingProxyType(
         {
             "url": "https://www.twitch.tv/testuser1",
             "alias": "Test User 1",
@@ -136,7 +232,9 @@ def mock_live_stream_info() -> List[Dict[str, Any]]:
             "category_keywords": "Gaming",
             "viewer_count": 1234,
             "is_live": True,
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "url": "https://www.youtube.com/@testchannel",
             "alias": "Test Channel",
@@ -146,17 +244,60 @@ def mock_live_stream_info() -> List[Dict[str, Any]]:
             "category_keywords": "Music",
             "viewer_count": 5678,
             "is_live": True,
-        },
-    ]
+        }
+    ),
+)
+
+
+@pytest.fixture(scope="module")
+def mock_live_stream_info() -> List[Dict[str, Any]]:
+    """Sample live stream info, copied from read-only templates once per module."""
+    return [dict(stream) for stream in _LIVE_STREAM_INFO]
 
 
 @pytest.fixture(autouse=True)
-def mock_user_config_dir(temp_config_dir, monkeypatch):
+def mock_user_config_dir(tmp_path, monkeypatch):
     """Automatically mock the user config directory for all tests."""
-    monkeypatch.setattr("src.streamwatch.config.USER_CONFIG_DIR", temp_config_dir)
+    monkeypatch.setattr("src.streamwatch.config.USER_CONFIG_DIR", tmp_path)
     monkeypatch.setattr(
-        "src.streamwatch.config.STREAMS_FILE_PATH", temp_config_dir / "streams.json"
+        "src.streamwatch.config.STREAMS_FILE_PATH", tmp_path / "streams.json"
     )
     monkeypatch.setattr(
-        "src.streamwatch.config.CONFIG_FILE_PATH", temp_config_dir / "config.ini"
+        "src.streamwatch.config.CONFIG_FILE_PATH", tmp_path / "config.ini"
     )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _silence_logging():
+    """Disable log records for the whole session.
+
+    Nothing asserts on log output, and formatting records (often with mock
+    reprs) is wasted work in every error-path test. A test that needs log
+    records can call ``logging.disable(logging.NOTSET)`` and must put
+    ``logging.disable(logging.CRITICAL)`` back in a ``finally`` block.
+    """
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def pytest_configure(config):
+    """Skip benchmarks by default when pytest-benchmark is installed.
+
+    Set here rather than in pytest.ini addopts so that runs without the plugin
+    (e.g. ``-p no:benchmark`` or an environment without it) still work.
+    ``--benchmark-only`` opts back in.
+    """
+    if config.pluginmanager.hasplugin("benchmark") and not config.getoption(
+        "benchmark_only"
+    ):
+        config.option.benchmark_skip = True
+
+
+def pytest_ignore_collect(collection_path, config):
+    """Leave out the benchmarks when pytest-benchmark is not available."""
+    if collection_path.name == "benchmarks" and not config.pluginmanager.hasplugin(
+        "benchmark"
+    ):
+        return True
+    return None
@@ -1,8 +1,6 @@
 """Integration tests for configuration loading and management."""
 
-from unittest.mock import patch
-
-import pytest
+import configparser
 
 from src.streamwatch import config
 
@@ -10,21 +8,24 @@ from src.streamwatch import config
 class TestConfigurationIntegration:
     """Test configuration loading and integration."""
 
-    def test_config_file_creation_and_defaults(self, tmp_path):
+    def test_config_file_creation_and_defaults(self, tmp_path, monkeypatch):
         """Test that a default config file is created and values are correct."""
         config_dir = tmp_path / "streamwatch"
         config_file = config_dir / "config.ini"
 
-        # Patch the config path to use our temporary directory
-        with patch.object(config, "CONFIG_FILE_PATH", config_file), patch.object(
-            config, "USER_CONFIG_DIR", config_dir
-        ):
-            # This should create the file
-            config.load_config()
+        # Point the config paths at our temporary directory
+        monkeypatch.setattr(config, "CONFIG_FILE_PATH", config_file)
+        monkeypatch.setattr(config, "USER_CONFIG_DIR", config_dir)
+        # load_config() fills the module-global parser in place; give it a
+        # fresh one so the values read here don't leak into later tests
+        monkeypatch.setattr(config, "config_parser", configparser.ConfigParser())
+
+        # This should create the file
+        config.load_config()
 
-            # Verify the file was created
-            assert config_file.exists()
+        # Verify the file was created
+        assert config_file.exists()
 
-            # Verify we can read default values
-            assert config.get_streamlink_quality() == "best"
-            assert config.get_max_workers_liveness() == 4
+        # Verify we can read default values
+        assert config.get_streamlink_quality() == "best"
+        assert config.get_max_workers_liveness() == 4
@@ -0,0 +1,71 @@
+"""Integration tests for the live stream checking workflow."""
+
+import pytest
+
+from src.streamwatch import stream_checker
+from src.streamwatch.stream_checker import MetadataResult, StreamCheckResult
+
+
+class TestStreamCheckingWorkflow:
+    """Test fetch_live_streams end to end with streamlink calls stubbed out.
+
+    The stubs are plain functions rather than mocks: they are called once per
+    stream from worker threads, and none of these tests inspect call history
+    beyond what a closure can record.
+    """
+
+    @pytest.fixture(autouse=True)
+    def _stub_streamlink(self, monkeypatch, sample_stream_metadata_json):
+        """Install the liveness/metadata stubs shared by every test in the class.
+
+        Tests narrow ``self.live_urls`` to choose which streams report live
+        (``None`` means all of them) and read ``self.metadata_requests``.
+        """
+        self.live_urls = None
+        self.metadata_requests = []
+
+        def fake_liveness(url):
+            is_live = self.live_urls is None or url in self.live_urls
+            return StreamCheckResult(is_live=is_live, url=url)
+
+        def fake_metadata(url):
+            self.metadata_requests.append(url)
+            return MetadataResult(
+                success=True, url=url, json_data=sample_stream_metadata_json
+            )
+
+        monkeypatch.setattr(
+            stream_checker, "is_stream_live_for_check_detailed", fake_liveness
+        )
+        monkeypatch.setattr(
+            stream_checker, "get_stream_metadata_json_detailed", fake_metadata
+        )
+
+    @pytest.mark.parametrize(
+        "live_indexes",
+        [None, (0, 2), ()],
+        ids=["all-live", "mixed", "none-live"],
+    )
+    def test_live_stream_detection_workflow(self, sample_stream_data, live_indexes):
+        """Test that only streams reported live are returned and enriched."""
+        if live_indexes is None:
+            expected_urls = frozenset(s["url"] for s in sample_stream_data)
+        else:
+            expected_urls = frozenset(
+                sample_stream_data[i]["url"] for i in live_indexes
+            )
+            self.live_urls = expected_urls
+
+        live_streams = stream_checker.fetch_live_streams(sample_stream_data)
+
+        assert frozenset(s["url"] for s in live_streams) == expected_urls
+        assert frozenset(self.metadata_requests) == expected_urls
+
+    def test_metadata_extraction_workflow(self, sample_stream_data):
+        """Test that fetched metadata is merged into the returned streams."""
+        live_streams = stream_checker.fetch_live_streams(sample_stream_data)
+
+        assert len(live_streams) == len(sample_stream_data)
+        for stream in live_streams:
+            assert stream["title"] == "Test Stream Title"
+            assert stream["viewer_count"] == 1234
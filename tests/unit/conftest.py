@@ -0,0 +1,57 @@
+"""
+Shared fixtures for StreamWatch unit tests.
+"""
+
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.streamwatch import player, ui
+from src.streamwatch.stream_utils import parse_url_metadata
+
+
+@pytest.fixture(scope="session")
+def mock_ui_template():
+    """An autospec'd mock of the ``ui`` package, built once per session."""
+    return create_autospec(ui, spec_set=True)
+
+
+@pytest.fixture
+def mock_ui(mock_ui_template):
+    """The session ``ui`` mock with call history and configured returns cleared.
+
+    Resetting is used instead of ``copy.copy``: a shallow copy of a mock shares
+    its child mocks, so calls would leak between tests.
+    """
+    mock_ui_template.reset_mock(return_value=True, side_effect=True)
+    return mock_ui_template
+
+
+@pytest.fixture(scope="session")
+def mock_player_template():
+    """An autospec'd mock of the ``player`` module, built once per session."""
+    return create_autospec(player, spec_set=True)
+
+
+@pytest.fixture
+def mock_player(mock_player_template):
+    """The session ``player`` mock with call history and configured returns cleared."""
+    mock_player_template.reset_mock(return_value=True, side_effect=True)
+    return mock_player_template
+
+
+class _ParsedUrls(dict):
+    """``parse_url_metadata`` results keyed by URL, parsed on first lookup."""
+
+    def __missing__(self, url):
+        result = self[url] = parse_url_metadata(url)
+        return result
+
+
+@pytest.fixture(scope="session")
+def parsed_urls():
+    """Memoized ``parse_url_metadata`` results shared by the URL parsing tests.
+
+    Tests must treat the returned dicts as read-only.
+    """
+    return _ParsedUrls()
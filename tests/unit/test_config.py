@@ -1,11 +1,29 @@
 """Unit tests for configuration management module."""
 
-from unittest.mock import patch
+import configparser
 
 import pytest
 
 from src.streamwatch import config
 
+_CUSTOM_INI = "[Streamlink]\nquality = 720p\n"
+
+
+@pytest.fixture(scope="session")
+def default_config_parser():
+    """A parser pre-populated from DEFAULT_CONFIG, built once per session."""
+    parser = configparser.ConfigParser()
+    parser.read_dict(config.DEFAULT_CONFIG)
+    return parser
+
+
+@pytest.fixture(scope="session")
+def custom_config_parser():
+    """A parser pre-populated from a custom INI snippet, built once per session."""
+    parser = configparser.ConfigParser()
+    parser.read_string(_CUSTOM_INI)
+    return parser
+
 
 class TestConfigManagement:
     """Test configuration loading and management."""
@@ -15,18 +33,12 @@ class TestConfigManagement:
         assert "Streamlink" in config.DEFAULT_CONFIG
         assert config.DEFAULT_CONFIG["Streamlink"]["quality"] == "best"
 
-    def test_get_streamlink_quality_default(self):
+    def test_get_streamlink_quality_default(self, monkeypatch, default_config_parser):
         """Test getting streamlink quality with default value."""
-        with patch.object(config.config_parser, "get", return_value="best"):
-            quality = config.get_streamlink_quality()
-            assert quality == "best"
-
-    def test_config_parsing_with_custom_values(self, tmp_path):
-        """Test config parsing with custom values."""
-        config_content = "[Streamlink]\nquality = 720p\n"
-        config_file = tmp_path / "config.ini"
-        config_file.write_text(config_content)
-
-        with patch.object(config, "CONFIG_FILE_PATH", config_file):
-            config.load_config()  # Force reload
-            assert config.get_streamlink_quality() == "720p"
+        monkeypatch.setattr(config, "config_parser", default_config_parser)
+        assert config.get_streamlink_quality() == "best"
+
+    def test_config_parsing_with_custom_values(self, monkeypatch, custom_config_parser):
+        """Test config accessors with custom values."""
+        monkeypatch.setattr(config, "config_parser", custom_config_parser)
+        assert config.get_streamlink_quality() == "720p"
@@ -1,13 +1,15 @@
 """Tests for the main application entry point and orchestration."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
+from src.streamwatch import core
 from src.streamwatch.app import StreamWatchApp
 
 
-@patch("src.streamwatch.app.StreamWatchApp._run_interactive_loop")
+@patch.object(StreamWatchApp, "_run_interactive_loop")
 def test_app_run_handles_keyboard_interrupt(mock_loop):
     """Verify the app's main run method can be started and handles KeyboardInterrupt."""
     # Simulate the user pressing Ctrl+C during the loop
@@ -31,3 +33,72 @@ def test_app_initialization():
     assert app.stream_manager is not None
     assert app.playback_controller is not None
     assert app.container is not None
+
+
+@pytest.fixture
+def patched_core(monkeypatch):
+    """Replace run_interactive_loop's collaborators with mocks in one place."""
+    mocks = SimpleNamespace(
+        # Stubs for collaborators whose calls no test inspects.
+        ui=SimpleNamespace(
+            clear_screen=lambda: None,
+            console=SimpleNamespace(print=lambda *args, **kwargs: None),
+        ),
+        stream_manager=SimpleNamespace(),
+        playback_controller=SimpleNamespace(),
+        # Only process_menu_choice is scripted per test; the other menu
+        # methods run once per loop iteration and are never inspected.
+        menu_handler=SimpleNamespace(
+            clear_message=lambda: None,
+            display_streams_with_pagination=lambda *args, **kwargs: None,
+            display_main_menu=lambda count: None,
+            handle_user_input=lambda: "",
+            process_menu_choice=Mock(),
+        ),
+        # Mocks for collaborators whose calls are asserted on.
+        config=Mock(),
+        show_welcome=Mock(),
+        refresh=Mock(return_value=[]),
+    )
+    monkeypatch.setattr(core, "ui", mocks.ui)
+    monkeypatch.setattr(core, "config", mocks.config)
+    monkeypatch.setattr(core, "MenuHandler", lambda: mocks.menu_handler)
+    monkeypatch.setattr(core, "StreamManager", lambda: mocks.stream_manager)
+    monkeypatch.setattr(core, "PlaybackController", lambda: mocks.playback_controller)
+    monkeypatch.setattr(core, "_show_first_time_welcome", mocks.show_welcome)
+    monkeypatch.setattr(core, "_refresh_live_streams", mocks.refresh)
+    return mocks
+
+
+@pytest.mark.parametrize(
+    "first_run_completed, expect_welcome",
+    [(False, True), (True, False)],
+    ids=["first_time", "normal_user"],
+)
+def test_run_interactive_loop_welcome(
+    patched_core, first_run_completed, expect_welcome
+):
+    """Verify the welcome screen is shown and recorded only on the first run."""
+    patched_core.config.is_first_run_completed.return_value = first_run_completed
+    patched_core.menu_handler.process_menu_choice.return_value = (False, False)
+
+    core.run_interactive_loop()
+
+    assert patched_core.show_welcome.called is expect_welcome
+    assert patched_core.config.mark_first_run_completed.called is expect_welcome
+    patched_core.refresh.assert_called_once_with(patched_core.stream_manager)
+
+
+def test_run_interactive_loop_with_refresh(patched_core):
+    """Verify a menu choice requesting a refresh re-fetches live streams."""
+    patched_core.config.is_first_run_completed.return_value = True
+    choices = iter([(True, True), (False, False)])
+    patched_core.menu_handler.process_menu_choice = lambda *args, **kwargs: next(
+        choices
+    )
+
+    core.run_interactive_loop()
+
+    assert patched_core.refresh.call_count == 2
+    # Both scripted choices were consumed, i.e. the menu was processed twice.
+    assert next(choices, None) is None
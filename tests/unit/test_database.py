@@ -1,35 +1,85 @@
 """Tests for the StreamDatabase class."""
 
-from pathlib import Path
-
 import pytest
 
 from src.streamwatch.database import StreamDatabase
 from src.streamwatch.models import StreamInfo
 
+# User-data tables emptied between tests; ``platforms`` keeps only its seed rows.
+_DATA_TABLES = ("stream_checks", "stream_preferences", "streams", "app_config")
+
+
+@pytest.fixture(scope="session")
+def _db_template() -> StreamDatabase:
+    """An in-memory database whose schema is created once per session.
+
+    StreamDatabase keeps one connection per thread, so the in-memory database
+    lives as long as the test thread's connection; these tests are
+    single-threaded.
+    """
+    database = StreamDatabase(db_path=":memory:")
+    yield database
+    database.close()
+
+
+@pytest.fixture(scope="session")
+def _seeded_platform_max_id(_db_template: StreamDatabase) -> int:
+    """Highest ``platforms`` id from the schema's seed rows."""
+    with _db_template.transaction() as conn:
+        return conn.execute("SELECT MAX(id) FROM platforms").fetchone()[0]
+
 
 @pytest.fixture
-def db(tmp_path: Path) -> StreamDatabase:
-    """Provides an in-memory SQLite database for testing."""
-    db_path = tmp_path / "test_streamwatch.db"
-    return StreamDatabase(db_path=db_path)
+def db(_db_template: StreamDatabase, _seeded_platform_max_id: int) -> StreamDatabase:
+    """Provides the shared in-memory database, emptied after each test.
+
+    StreamDatabase opens its own BEGIN for every write, so per-test state is
+    reset by deleting rows rather than rolling back an enclosing savepoint.
+    Platforms added by ``save_stream`` are removed too; the seed rows stay.
+
+    ``get_connection`` closes the connection when an operation raises, which
+    discards the in-memory database; the schema is then rebuilt instead.
+    """
+    yield _db_template
+    with _db_template.get_connection() as conn:
+        has_schema = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'streams'"
+        ).fetchone()
+    if has_schema is None:
+        _db_template._initialize_database()
+        return
+    with _db_template.transaction() as conn:
+        for table in _DATA_TABLES:
+            conn.execute(f"DELETE FROM {table}")  # nosec B608
+        conn.execute("DELETE FROM platforms WHERE id > ?", (_seeded_platform_max_id,))
+
+
+@pytest.fixture(scope="session")
+def stream_info_proto() -> StreamInfo:
+    """A validated StreamInfo that tests derive variants from via ``model_copy``.
+
+    ``model_copy`` does not re-run validation, so variants are only built from
+    values that would pass it.
+    """
+    return StreamInfo(
+        url="https://twitch.tv/test_streamer",
+        alias="Test Streamer",
+        platform="Twitch",
+        username="test_streamer",
+    )
 
 
 class TestStreamDatabase:
     """Test database operations for streams."""
 
-    def test_save_and_load_streams(self, db: StreamDatabase):
+    def test_save_and_load_streams(
+        self, db: StreamDatabase, stream_info_proto: StreamInfo
+    ):
         """Test saving a new stream and loading it back."""
         # Ensure the database is empty initially
         assert db.load_streams() == []
 
-        # Create a new stream object to save
-        stream_to_save = StreamInfo(
-            url="https://twitch.tv/test_streamer",
-            alias="Test Streamer",
-            platform="Twitch",
-            username="test_streamer",
-        )
+        stream_to_save = stream_info_proto
 
         # Save the stream
         db.save_stream(stream_to_save)
@@ -45,13 +95,14 @@ class TestStreamDatabase:
         assert saved_stream.alias == stream_to_save.alias
         assert saved_stream.platform == "Twitch"
 
-    def test_delete_stream(self, db: StreamDatabase):
+    def test_delete_stream(self, db: StreamDatabase, stream_info_proto: StreamInfo):
         """Test saving a stream and then marking it as inactive."""
-        stream_to_save = StreamInfo(
-            url="https://twitch.tv/to_be_deleted",
-            alias="To Be Deleted",
-            platform="Twitch",
-            username="to_be_deleted",
+        stream_to_save = stream_info_proto.model_copy(
+            update={
+                "url": "https://twitch.tv/to_be_deleted",
+                "alias": "To Be Deleted",
+                "username": "to_be_deleted",
+            }
         )
 
         # Save and verify it's there
@@ -1,5 +1,7 @@
 """Tests for exceptions module."""
 
+import functools
+
 import pytest
 
 from src.streamwatch.exceptions import (
@@ -12,12 +14,22 @@ from src.streamwatch.exceptions import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _err(cls, message, **kwargs):
+    """Build an error instance once per distinct set of arguments.
+
+    The tests below only read attributes, so instances can be shared; never
+    ``raise`` one, as that would attach a traceback to the cached object.
+    """
+    return cls(message, **kwargs)
+
+
 class TestStreamlinkError:
     """Test StreamlinkError base exception."""
 
     def test_basic_creation(self):
         """Test creating basic StreamlinkError."""
-        error = StreamlinkError("Test error")
+        error = _err(StreamlinkError, "Test error")
 
         assert str(error) == "Test error"
         assert error.url is None
@@ -27,8 +39,9 @@ class TestStreamlinkError:
 
     def test_full_creation(self):
         """Test creating StreamlinkError with all parameters."""
-        error = StreamlinkError(
-            message="Test error",
+        error = _err(
+            StreamlinkError,
+            "Test error",
             url="https://twitch.tv/test",
             stderr="Error output",
             stdout="Normal output",
@@ -43,8 +56,9 @@ class TestStreamlinkError:
 
     def test_to_dict(self):
         """Test converting error to dictionary."""
-        error = StreamlinkError(
-            message="Test error",
+        error = _err(
+            StreamlinkError,
+            "Test error",
             url="https://twitch.tv/test",
             stderr="Error output",
             return_code=1,
@@ -59,75 +73,43 @@ class TestStreamlinkError:
         assert result["return_code"] == 1
 
 
-class TestStreamNotFoundError:
-    """Test StreamNotFoundError exception."""
-
-    def test_creation(self):
-        """Test creating StreamNotFoundError."""
-        error = StreamNotFoundError("Stream not found", url="https://twitch.tv/test")
-
-        assert str(error) == "Stream not found"
-        assert error.url == "https://twitch.tv/test"
-        assert isinstance(error, StreamlinkError)
-
-    def test_to_dict(self):
-        """Test converting to dictionary."""
-        error = StreamNotFoundError("Stream not found", url="https://twitch.tv/test")
-        result = error.to_dict()
-
-        assert result["error_type"] == "StreamNotFoundError"
-
-
-class TestStreamOfflineError:
-    """Test TimeoutError exception."""
-
-    def test_creation(self):
-        """Test creating TimeoutError."""
-        error = TimeoutError("Stream timeout", url="https://twitch.tv/test")
-
-        assert str(error) == "Stream timeout"
-        assert error.url == "https://twitch.tv/test"
-        assert isinstance(error, StreamlinkError)
-
-
-class TestUnsupportedPlatformError:
-    """Test AuthenticationError exception."""
-
-    def test_creation(self):
-        """Test creating AuthenticationError."""
-        error = AuthenticationError("Auth failed", url="https://example.com/test")
-
-        assert str(error) == "Auth failed"
-        assert error.url == "https://example.com/test"
-        assert isinstance(error, StreamlinkError)
+_STREAMLINK_SUBCLASSES = [
+    StreamNotFoundError,
+    TimeoutError,
+    AuthenticationError,
+    NetworkError,
+    RateLimitExceededError,
+]
 
 
-class TestNetworkError:
-    """Test NetworkError exception."""
+@pytest.mark.parametrize("cls", _STREAMLINK_SUBCLASSES, ids=lambda c: c.__name__)
+@pytest.mark.parametrize(
+    "url", [None, "https://twitch.tv/test"], ids=["no-url", "with-url"]
+)
+def test_subclass_creation(cls, url):
+    """Test creating each StreamlinkError subclass with and without a URL."""
+    error = _err(cls, "Test error", url=url)
 
-    def test_creation(self):
-        """Test creating NetworkError."""
-        error = NetworkError("Network error", url="https://twitch.tv/test")
+    assert str(error) == "Test error"
+    assert error.url == url
+    assert isinstance(error, StreamlinkError)
 
-        assert str(error) == "Network error"
-        assert error.url == "https://twitch.tv/test"
-        assert isinstance(error, StreamlinkError)
 
+@pytest.mark.parametrize("cls", _STREAMLINK_SUBCLASSES, ids=lambda c: c.__name__)
+def test_subclass_to_dict(cls):
+    """Test that each subclass reports its own error type."""
+    error = _err(cls, "Test error", url="https://twitch.tv/test")
 
-class TestPlayerError:
-    """Test RateLimitExceededError exception."""
+    assert error.to_dict()["error_type"] == cls.__name__
 
-    def test_creation(self):
-        """Test creating RateLimitExceededError."""
-        error = RateLimitExceededError("Rate limited", url="https://twitch.tv/test")
 
-        assert str(error) == "Rate limited"
-        assert error.url == "https://twitch.tv/test"
-        assert isinstance(error, StreamlinkError)
+class TestRateLimitExceededError:
+    """Test RateLimitExceededError-specific attributes."""
 
     def test_with_platform_and_retry_after(self):
         """Test creating RateLimitExceededError with platform and retry_after."""
-        error = RateLimitExceededError(
+        error = _err(
+            RateLimitExceededError,
             "Rate limited",
             url="https://twitch.tv/test",
             platform="Twitch",
@@ -139,7 +121,8 @@ class TestPlayerError:
 
     def test_to_dict(self):
         """Test converting to dictionary."""
-        error = RateLimitExceededError(
+        error = _err(
+            RateLimitExceededError,
             "Rate limited",
             url="https://twitch.tv/test",
             platform="Twitch",
@@ -150,36 +133,3 @@ class TestPlayerError:
         assert result["error_type"] == "RateLimitExceededError"
         assert result["platform"] == "Twitch"
         assert result["retry_after"] == 60.0
-
-
-class TestConfigurationError:
-    """Test NetworkError exception (additional tests)."""
-
-    def test_creation(self):
-        """Test creating NetworkError."""
-        error = NetworkError("Network error")
-
-        assert str(error) == "Network error"
-        assert isinstance(error, StreamlinkError)
-
-
-class TestRateLimitError:
-    """Test AuthenticationError exception (additional tests)."""
-
-    def test_creation(self):
-        """Test creating AuthenticationError."""
-        error = AuthenticationError("Auth error")
-
-        assert str(error) == "Auth error"
-        assert isinstance(error, StreamlinkError)
-
-
-class TestCircuitBreakerError:
-    """Test TimeoutError exception (additional tests)."""
-
-    def test_creation(self):
-        """Test creating TimeoutError."""
-        error = TimeoutError("Timeout error")
-
-        assert str(error) == "Timeout error"
-        assert isinstance(error, StreamlinkError)
@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import pytest
 
@@ -6,10 +6,18 @@ from src.streamwatch.menu_handler import MenuHandler
 
 
 class TestMenuHandler:
-    def test_init(self):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"command_invoker": SimpleNamespace()}],
+        ids=["default", "injected"],
+    )
+    def test_init(self, kwargs):
         """Test MenuHandler initialization."""
-        mh = MenuHandler(command_invoker=Mock())
+        mh = MenuHandler(**kwargs)
         assert mh.last_message == ""
+        assert mh.command_invoker is not None
+        if "command_invoker" in kwargs:
+            assert mh.command_invoker is kwargs["command_invoker"]
 
     def test_clear_message(self):
         """Test clearing the last message."""
@@ -18,19 +26,17 @@ class TestMenuHandler:
         mh.clear_message()
         assert mh.last_message == ""
 
-    @patch("src.streamwatch.menu_handler.ui")
-    def test_display_main_menu(self, mock_ui):
+    def test_display_main_menu(self, monkeypatch, mock_ui):
         """Test displaying the main menu."""
+        monkeypatch.setattr("src.streamwatch.menu_handler.ui", mock_ui)
         mh = MenuHandler()
         mh.display_main_menu(5)
         mock_ui.display_main_menu.assert_called_once_with(5)
 
-    def test_handle_user_input_with_mock(self):
+    def test_handle_user_input_with_mock(self, monkeypatch, mock_ui):
         """Test handling user input."""
+        monkeypatch.setattr("src.streamwatch.menu_handler.ui", mock_ui)
+        mock_ui.prompt_main_menu_action.return_value = "q"
         mh = MenuHandler()
-        with patch(
-            "src.streamwatch.menu_handler.ui.prompt_main_menu_action"
-        ) as mock_input:
-            mock_input.return_value = "q"
-            result = mh.handle_user_input()
-            assert result == "q"
+        result = mh.handle_user_input()
+        assert result == "q"
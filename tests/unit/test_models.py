@@ -1,6 +1,6 @@
 """Tests for the models module."""
 
-from datetime import datetime
+import functools
 
 import pytest
 
@@ -13,6 +13,12 @@ from src.streamwatch.models import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _stream(url, alias, **kwargs):
+    """Validate each distinct StreamInfo once; instances are frozen, so shareable."""
+    return StreamInfo(url=url, alias=alias, **kwargs)
+
+
 class TestStreamInfo:
     """Test StreamInfo model validation and functionality."""
 
@@ -38,7 +44,7 @@ class TestStreamInfo:
 
     def test_stream_info_to_dict(self):
         """Test converting StreamInfo to dictionary."""
-        stream = StreamInfo(url="https://www.twitch.tv/testuser", alias="Test User")
+        stream = _stream("https://www.twitch.tv/testuser", "Test User")
 
         result = stream.to_dict()
         assert isinstance(result, dict)
@@ -58,17 +64,22 @@ class TestStreamInfo:
         assert stream.url == "https://www.twitch.tv/testuser"
         assert stream.alias == "Test User"
 
-    def test_stream_info_invalid_url(self):
-        """Test StreamInfo validation with invalid URL."""
-        with pytest.raises(ValueError):
-            StreamInfo(url="not-a-url", alias="Test User")
-
-    def test_stream_info_negative_viewer_count(self):
-        """Test StreamInfo validation with negative viewer count."""
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"url": "not-a-url", "alias": "Test User"},
+            {
+                "url": "https://www.twitch.tv/testuser",
+                "alias": "Test User",
+                "viewer_count": -1,
+            },
+        ],
+        ids=["invalid-url", "negative-viewers"],
+    )
+    def test_stream_info_validation(self, kwargs):
+        """Test that StreamInfo rejects invalid field values."""
         with pytest.raises(ValueError):
-            StreamInfo(
-                url="https://www.twitch.tv/testuser", alias="Test User", viewer_count=-1
-            )
+            StreamInfo(**kwargs)
 
 
 class TestUrlMetadata:
@@ -98,7 +109,7 @@ class TestPlaybackSession:
 
     def test_create_playback_session(self):
         """Test creating a PlaybackSession object."""
-        stream = StreamInfo(url="https://www.twitch.tv/testuser", alias="Test User")
+        stream = _stream("https://www.twitch.tv/testuser", "Test User")
 
         session = PlaybackSession(
             current_stream=stream, current_quality="best", all_live_streams=[stream]
@@ -109,35 +120,33 @@ class TestPlaybackSession:
         assert len(session.all_live_streams) == 1
         assert session.current_index == 0
 
-    def test_playback_session_get_next_stream(self):
-        """Test getting next stream in playback session."""
-        stream1 = StreamInfo(url="https://www.twitch.tv/user1", alias="User 1")
-        stream2 = StreamInfo(url="https://www.twitch.tv/user2", alias="User 2")
-
-        session = PlaybackSession(
-            current_stream=stream1,
-            current_quality="best",
-            all_live_streams=[stream1, stream2],
-            current_index=0,
-        )
-
-        next_stream = session.get_next_stream()
-        assert next_stream == stream2
-
-    def test_playback_session_get_previous_stream(self):
-        """Test getting previous stream in playback session."""
-        stream1 = StreamInfo(url="https://www.twitch.tv/user1", alias="User 1")
-        stream2 = StreamInfo(url="https://www.twitch.tv/user2", alias="User 2")
-
+    @pytest.mark.parametrize(
+        "index, direction, expected_url",
+        [
+            (0, "next", "https://www.twitch.tv/user2"),
+            (1, "previous", "https://www.twitch.tv/user1"),
+            (1, "next", "https://www.twitch.tv/user1"),
+            (0, "previous", "https://www.twitch.tv/user2"),
+        ],
+        ids=["next", "previous", "next-wraps", "previous-wraps"],
+    )
+    def test_playback_session_navigation(self, index, direction, expected_url):
+        """Test next/previous navigation, including wrap-around at both ends."""
+        streams = [
+            _stream("https://www.twitch.tv/user1", "User 1"),
+            _stream("https://www.twitch.tv/user2", "User 2"),
+        ]
         session = PlaybackSession(
-            current_stream=stream2,
+            current_stream=streams[index],
             current_quality="best",
-            all_live_streams=[stream1, stream2],
-            current_index=1,
+            all_live_streams=streams,
         )
 
-        prev_stream = session.get_previous_stream()
-        assert prev_stream == stream1
+        if direction == "next":
+            stream = session.get_next_stream()
+        else:
+            stream = session.get_previous_stream()
+        assert stream.url == expected_url
 
 
 class TestStreamStatus:
@@ -1,15 +1,113 @@
-from unittest.mock import Mock, patch
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
+from src.streamwatch import playback_controller
 from src.streamwatch.playback_controller import PlaybackController
 
+# Shared stream dicts; the controller only reads them.
+_STREAM_A = {"url": "test_url", "username": "test_user"}
+_STREAM_NEXT = {"url": "next_url", "username": "next_user"}
+_STREAM_PREV = {"url": "prev_url", "username": "prev_user"}
+_STREAM_LIST = (_STREAM_PREV, _STREAM_A, _STREAM_NEXT)
+
+# Config reads are never asserted on, so a plain namespace replaces a Mock.
+_CONFIG_STUB = SimpleNamespace(
+    get_streamlink_quality=lambda: "best",
+    get_donation_link=lambda: "https://donate.example.com",
+)
+
+
+@pytest.fixture(autouse=True)
+def deps(monkeypatch, mock_player, mock_ui):
+    """Replace every collaborator of the controller in one place.
+
+    ``player`` and ``ui`` are the shared autospec mocks, ``config`` is the
+    preset ``_CONFIG_STUB``, and ``time.sleep`` is a no-op so status-message
+    pauses cost nothing.
+    """
+    stubs = SimpleNamespace(player=mock_player, ui=mock_ui, config=_CONFIG_STUB)
+    monkeypatch.setattr(playback_controller, "player", stubs.player)
+    monkeypatch.setattr(playback_controller, "ui", stubs.ui)
+    monkeypatch.setattr(playback_controller, "config", stubs.config)
+    monkeypatch.setattr(
+        playback_controller, "time", SimpleNamespace(sleep=lambda seconds: None)
+    )
+    return stubs
+
+
+@pytest.fixture(scope="class")
+def pc():
+    """One controller per test class; PlaybackController holds no state."""
+    return PlaybackController()
+
 
 class TestPlaybackController:
-    @patch("src.streamwatch.playback_controller.player")
-    def test_stop_playback(self, mock_player):
+    def test_stop_playback(self, pc, deps):
         """Test stopping playback."""
-        pc = PlaybackController()
-        mock_process = Mock()
-        pc.stop_playback(mock_process, {}, "best")
-        mock_player.terminate_player_process.assert_called_with(mock_process)
+        mock_process = Mock(spec=subprocess.Popen)
+        pc.stop_playback(mock_process, _STREAM_A, "best")
+        deps.player.terminate_player_process.assert_called_with(mock_process)
+        deps.player.execute_hook.assert_called_once_with("post", _STREAM_A, "best")
+
+    @pytest.mark.parametrize(
+        "action, can_navigate, expected_terminate, expected_return_action, "
+        "expected_style",
+        [
+            pytest.param("stop", False, False, None, None, id="stop"),
+            pytest.param(
+                "main_menu", False, True, "return_to_main", "info", id="main_menu"
+            ),
+            pytest.param("quit", False, True, "quit_application", None, id="quit"),
+            pytest.param("next", False, False, None, "warning", id="next_not_possible"),
+            pytest.param(
+                "previous", False, False, None, "warning", id="previous_not_possible"
+            ),
+            pytest.param("unknown", False, False, None, None, id="unknown_action"),
+        ],
+    )
+    def test_handle_simple_controls(
+        self,
+        pc,
+        deps,
+        action,
+        can_navigate,
+        expected_terminate,
+        expected_return_action,
+        expected_style,
+    ):
+        """Test controls that only set flags and, at most, print a message."""
+        result = pc.handle_playback_controls(
+            action, None, _STREAM_A, "best", [], 0, can_navigate, None
+        )
+
+        assert result["terminate"] is expected_terminate
+        assert result["return_action"] == expected_return_action
+        if expected_style is None:
+            deps.ui.console.print.assert_not_called()
+        else:
+            assert deps.ui.console.print.call_args.kwargs["style"] == expected_style
+
+    @pytest.mark.parametrize(
+        "action, expected_stream, expected_index, expected_direction",
+        [
+            ("next", _STREAM_NEXT, 2, 1),
+            ("previous", _STREAM_PREV, 0, -1),
+        ],
+        ids=["next", "previous"],
+    )
+    def test_handle_navigation(
+        self, pc, deps, action, expected_stream, expected_index, expected_direction
+    ):
+        """Test that next/previous select the neighbouring stream."""
+        result = pc.handle_playback_controls(
+            action, None, _STREAM_A, "720p", _STREAM_LIST, 1, True, None
+        )
+
+        assert result["new_stream_info"] is expected_stream
+        assert result["new_index"] == expected_index
+        assert result["user_intent_direction"] == expected_direction
+        assert result["new_quality"] == "best"
+        assert result["terminate"] is False
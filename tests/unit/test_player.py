@@ -1,44 +1,94 @@
-from unittest.mock import Mock, patch
+import json
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
 from src.streamwatch import player
 
+pytestmark = pytest.mark.usefixtures("fake_subprocess")
+
+# `streamlink --json` payload, serialized once at import rather than per test.
+_QUALITIES_JSON = json.dumps(
+    {
+        "streams": {
+            "best": {"quality": "1080p"},
+            "720p": {"quality": "720p"},
+            "480p": {"quality": "480p"},
+            "worst": {"quality": "160p"},
+        }
+    }
+)
 
 class TestPlayerLaunching:
-    @patch("src.streamwatch.player.subprocess.Popen")
-    @patch("src.streamwatch.player.config")
-    def test_launch_player_success(self, mock_config, mock_popen):
-        """Test successful player launch."""
-        mock_process = Mock()
+    @pytest.mark.parametrize("quality", ["best", "720p", "480p"])
+    def test_launch_player_success(self, fake_subprocess, monkeypatch, quality):
+        """Test successful player launch at each quality."""
+        monkeypatch.setattr(player.config, "get_twitch_disable_ads", lambda: False)
+        # Skip the start-up grace period; the fake process never exits.
+        monkeypatch.setattr(player, "time", SimpleNamespace(sleep=lambda seconds: None))
+        mock_process = Mock(spec=subprocess.Popen)
         mock_process.poll.return_value = None
-        mock_popen.return_value = mock_process
+        fake_subprocess.Popen.return_value = mock_process
 
-        process = player.launch_player_process("https://test.tv/user", "best")
-        assert process is not None
-        mock_popen.assert_called_once()
+        process = player.launch_player_process("https://test.tv/user", quality)
+        assert process is mock_process
+        fake_subprocess.Popen.assert_called_once()
+        assert fake_subprocess.Popen.call_args[0][0][-2:] == [
+            "https://test.tv/user",
+            quality,
+        ]
+
+    @pytest.mark.parametrize(
+        "url, expect_flag",
+        [("https://twitch.tv/user", True), ("https://youtube.com/@user", False)],
+        ids=["twitch", "other"],
+    )
+    def test_streamlink_command_construction(
+        self, fake_subprocess, monkeypatch, url, expect_flag
+    ):
+        """Test that --twitch-disable-ads is only added for Twitch URLs."""
+        monkeypatch.setattr(player.config, "get_twitch_disable_ads", lambda: True)
+        monkeypatch.setattr(player, "time", SimpleNamespace(sleep=lambda seconds: None))
+        fake_subprocess.Popen.return_value = Mock(
+            spec=subprocess.Popen, **{"poll.return_value": None}
+        )
+
+        player.launch_player_process(url, "720p")
 
-    @patch("src.streamwatch.player.subprocess.Popen")
-    def test_launch_player_failure(self, mock_popen):
+        call_args = frozenset(fake_subprocess.Popen.call_args[0][0])
+        assert {"streamlink", url, "720p"} <= call_args
+        assert ("--twitch-disable-ads" in call_args) is expect_flag
+
+    def test_launch_player_failure(self, fake_subprocess):
         """Test player launch failure handling."""
-        mock_popen.side_effect = FileNotFoundError("Player not found")
+        fake_subprocess.Popen.side_effect = FileNotFoundError
 
         process = player.launch_player_process("https://test.tv/user", "best")
         assert process is None
 
-    def test_terminate_player_process(self):
-        """Test terminating a player process."""
-        mock_process = Mock()
-        mock_process.poll.return_value = None
+    @pytest.mark.parametrize(
+        "poll_return, expect_terminate",
+        [(None, True), (0, False)],
+        ids=["running", "already_finished"],
+    )
+    def test_terminate_player_process(self, poll_return, expect_terminate):
+        """Test that only a still-running process is terminated."""
+        mock_process = Mock(spec=subprocess.Popen)
+        mock_process.poll.return_value = poll_return
 
+        # Should not raise for a process that has already exited
         player.terminate_player_process(mock_process)
-        mock_process.terminate.assert_called_once()
+        assert mock_process.terminate.called is expect_terminate
 
-    def test_terminate_already_finished_process(self):
-        """Test terminating an already finished process."""
-        mock_process = Mock()
-        mock_process.poll.return_value = 0  # Already finished
 
-        # Should not raise an exception
-        player.terminate_player_process(mock_process)
-        mock_process.terminate.assert_not_called()
+class TestQualityFetching:
+    def test_fetch_available_qualities_success(self, fake_subprocess):
+        """Test parsing the qualities reported by streamlink --json."""
+        fake_subprocess.run.return_value = Mock(
+            spec=subprocess.CompletedProcess, returncode=0, stdout=_QUALITIES_JSON
+        )
+
+        qualities = player.fetch_available_qualities("https://test.tv/user")
+        assert qualities == ["best", "720p", "480p", "worst"]
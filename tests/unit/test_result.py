@@ -40,53 +40,49 @@ class TestResult:
         with pytest.raises(ValueError, match="Called unwrap"):
             result.unwrap()
 
-    def test_map_on_ok(self):
-        """Test map operation on Ok result."""
-        result = Result.Ok(5)
-        mapped = result.map(lambda x: x * 2)
-        
-        assert mapped.is_ok()
-        assert mapped.unwrap() == 10
-
-    def test_map_on_err(self):
-        """Test map operation on Err result."""
-        result = Result.Err("error")
-        mapped = result.map(lambda x: x * 2)
-        
-        assert mapped.is_err()
-        assert mapped.unwrap_err() == "error"
-
-    def test_and_then_on_ok(self):
-        """Test and_then operation on Ok result."""
-        result = Result.Ok(5)
-        chained = result.and_then(lambda x: Result.Ok(x * 2))
-        
-        assert chained.is_ok()
-        assert chained.unwrap() == 10
-
-    def test_and_then_on_err(self):
-        """Test and_then operation on Err result."""
-        result = Result.Err("error")
-        chained = result.and_then(lambda x: Result.Ok(x * 2))
-        
-        assert chained.is_err()
-        assert chained.unwrap_err() == "error"
-
-    def test_or_else_on_ok(self):
-        """Test or_else operation on Ok result."""
-        result = Result.Ok("success")
-        alternative = result.or_else(lambda e: Result.Ok("alternative"))
-        
-        assert alternative.is_ok()
-        assert alternative.unwrap() == "success"
-
-    def test_or_else_on_err(self):
-        """Test or_else operation on Err result."""
-        result = Result.Err("error")
-        alternative = result.or_else(lambda e: Result.Ok("alternative"))
-        
-        assert alternative.is_ok()
-        assert alternative.unwrap() == "alternative"
+    @pytest.mark.parametrize(
+        "result, op, expect_ok, expected",
+        [
+            (Result.Ok(5), lambda r: r.map(lambda x: x * 2), True, 10),
+            (Result.Err("error"), lambda r: r.map(lambda x: x * 2), False, "error"),
+            (Result.Ok(5), lambda r: r.and_then(lambda x: Result.Ok(x * 2)), True, 10),
+            (
+                Result.Err("error"),
+                lambda r: r.and_then(lambda x: Result.Ok(x * 2)),
+                False,
+                "error",
+            ),
+            (
+                Result.Ok("success"),
+                lambda r: r.or_else(lambda e: Result.Ok("alternative")),
+                True,
+                "success",
+            ),
+            (
+                Result.Err("error"),
+                lambda r: r.or_else(lambda e: Result.Ok("alternative")),
+                True,
+                "alternative",
+            ),
+        ],
+        ids=[
+            "map-ok",
+            "map-err",
+            "and_then-ok",
+            "and_then-err",
+            "or_else-ok",
+            "or_else-err",
+        ],
+    )
+    def test_combinators(self, result, op, expect_ok, expected):
+        """Test map/and_then/or_else on both Ok and Err results."""
+        combined = op(result)
+
+        assert combined.is_ok() is expect_ok
+        if expect_ok:
+            assert combined.unwrap() == expected
+        else:
+            assert combined.unwrap_err() == expected
 
     def test_equality(self):
         """Test Result equality comparison."""
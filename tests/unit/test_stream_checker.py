@@ -1,43 +1,82 @@
-from unittest.mock import Mock, patch
+import json
+import subprocess
 
 import pytest
 
-from src.streamwatch.stream_checker import StreamCheckResult, _is_stream_live_core
+from src.streamwatch.stream_checker import (
+    _is_stream_live_core,
+    extract_category_keywords,
+)
+
+# Successful metadata fetch result, serialized once at import.
+_META = (
+    True,
+    json.dumps({"metadata": {"title": "Test Stream Title", "game": "Test Game"}}),
+)
+
+
+@pytest.fixture(scope="module")
+def cp_live():
+    """A finished ``streamlink`` run that found streams."""
+    return subprocess.CompletedProcess(
+        args=[], returncode=0, stdout="Available streams: best", stderr=""
+    )
+
+
+@pytest.fixture(scope="module")
+def cp_offline():
+    """A finished ``streamlink`` run that found no streams."""
+    return subprocess.CompletedProcess(
+        args=[], returncode=1, stdout="", stderr="No streams found"
+    )
+
+
+@pytest.fixture
+def timeout_expired():
+    """A ``streamlink`` timeout, built per test so no traceback carries over."""
+    return subprocess.TimeoutExpired("streamlink", 10)
 
 
 class TestStreamLivenessChecking:
-    @patch("src.streamwatch.stream_checker.subprocess.run")
-    def test_is_stream_live_success(self, mock_run):
-        """Test successful stream liveness check."""
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = "Available streams: best"
-        mock_run.return_value.stderr = ""
-
-        result = _is_stream_live_core("https://test.tv/user")
-        assert result.is_live is True
-        assert result.url == "https://test.tv/user"
-        assert result.error is None
-
-    @patch("src.streamwatch.stream_checker.subprocess.run")
-    def test_is_stream_live_offline(self, mock_run):
-        """Test stream offline detection."""
-        mock_run.return_value.returncode = 1
-        mock_run.return_value.stdout = ""
-        mock_run.return_value.stderr = "No streams found"
-
-        result = _is_stream_live_core("https://test.tv/offline_user")
-        assert result.is_live is False
-        assert result.url == "https://test.tv/offline_user"
-        assert result.error is not None
-
-    @patch("src.streamwatch.stream_checker.subprocess.run")
-    def test_is_stream_live_timeout(self, mock_run):
-        """Test stream check timeout handling."""
-        from subprocess import TimeoutExpired
-
-        mock_run.side_effect = TimeoutExpired("streamlink", 10)
-
-        result = _is_stream_live_core("https://test.tv/timeout_user")
-        assert result.is_live is False
-        assert result.error is not None
-        assert "timeout" in str(result.error).lower()
+    @pytest.mark.parametrize(
+        "outcome, url, is_live, error_text",
+        [
+            ("cp_live", "https://test.tv/user", True, None),
+            ("cp_offline", "https://test.tv/offline_user", False, ""),
+            ("timeout_expired", "https://test.tv/timeout_user", False, "timeout"),
+        ],
+        ids=["success", "offline", "timeout"],
+    )
+    def test_is_stream_live(
+        self, request, stream_checker_run, outcome, url, is_live, error_text
+    ):
+        """Test liveness detection for live, offline and timed-out checks."""
+        outcome = request.getfixturevalue(outcome)
+        if isinstance(outcome, Exception):
+            stream_checker_run.side_effect = outcome
+        else:
+            stream_checker_run.return_value = outcome
+
+        result = _is_stream_live_core(url)
+        assert result.is_live is is_live
+        assert result.url == url
+        if error_text is None:
+            assert result.error is None
+        else:
+            assert result.error is not None
+            assert error_text in str(result.error).lower()
+
+
+class TestCategoryExtraction:
+    @pytest.mark.parametrize(
+        "metadata_result",
+        [(False, "Error"), (True, "invalid json"), (True, "{}")],
+        ids=["failed-fetch", "invalid-json", "empty-metadata"],
+    )
+    def test_extract_category_keywords_na(self, metadata_result):
+        """Test that unusable metadata yields N/A."""
+        assert extract_category_keywords(metadata_result, "Twitch") == "N/A"
+
+    def test_extract_category_keywords_twitch_game(self):
+        """Test that Twitch streams report the game as their category."""
+        assert extract_category_keywords(_META, "Twitch") == "Test Game"
@@ -1,33 +1,113 @@
 """Tests for the StreamManager class."""
 
-from unittest.mock import MagicMock, patch
+import json
+from types import SimpleNamespace
 
 import pytest
 
+from src.streamwatch import stream_manager
 from src.streamwatch.models import StreamInfo
 from src.streamwatch.stream_manager import StreamManager
 
+_IMPORT_TXT = (
+    "# Exported favourites\n"
+    "https://www.twitch.tv/import_one\n"
+    "\n"
+    "https://www.youtube.com/@importtwo\n"
+)
+# StreamInfo is frozen, so one instance can back every test.
+_TEST_STREAM = StreamInfo(url="https://twitch.tv/test", alias="Test")
+_TEST_STREAMS = (_TEST_STREAM,)
+_EXPORT_DATE = "2024-01-01"
 
-# Mock the database dependency for all tests in this class
-@pytest.fixture
-def mock_db():
-    """Provides a mock database object."""
-    return MagicMock()
+
+@pytest.fixture(scope="session")
+def import_txt(tmp_path_factory):
+    """A read-only .txt import file, written once per session."""
+    path = tmp_path_factory.mktemp("import") / "import.txt"
+    path.write_text(_IMPORT_TXT, encoding="utf-8")
+    return path
+
+
+class StubDB:
+    """Records the StreamDatabase calls StreamManager makes.
+
+    A hand-rolled stand-in is cheaper than a MagicMock and only exposes the
+    three methods the manager actually uses.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, streams=()):
+        self.streams = tuple(streams)
+        self.calls = []
+
+    def calls_to(self, name):
+        """Return the argument tuples of every call to ``name``."""
+        return [args for called, *args in self.calls if called == name]
+
+    def load_streams(self):
+        self.calls.append(("load_streams",))
+        return list(self.streams)
+
+    def save_stream(self, stream):
+        self.calls.append(("save_stream", stream))
+
+    def delete_stream(self, url):
+        self.calls.append(("delete_stream", url))
+        return True
+
+
+@pytest.fixture(scope="module")
+def _db_template():
+    """A stub database built once for the module."""
+    return StubDB()
+
+
+@pytest.fixture(autouse=True)
+def mock_db(_db_template):
+    """Provides the module's stub database, emptied before every test.
+
+    Autouse so that state scripted by one test never reaches the next, even
+    when that test only asks for ``manager``.
+    """
+    _db_template.reset()
+    return _db_template
 
 
 @pytest.fixture
-def manager(mock_db):
-    """Provides a StreamManager instance with a mocked database."""
-    return StreamManager(database=mock_db)
+def db_with_streams(mock_db):
+    """The stub database, holding ``_TEST_STREAMS``."""
+    mock_db.reset(_TEST_STREAMS)
+    return mock_db
+
+
+@pytest.fixture(autouse=True)
+def patched(monkeypatch, mock_ui):
+    """Swap the manager's ``ui`` and ``time`` module references in one place.
+
+    ``ui`` is routed to the shared autospec mock and ``time`` to a stub with
+    a fixed date, so export filenames are deterministic.
+    """
+    fake_time = SimpleNamespace(strftime=lambda fmt: _EXPORT_DATE)
+    monkeypatch.setattr(stream_manager, "ui", mock_ui)
+    monkeypatch.setattr(stream_manager, "time", fake_time)
+    return SimpleNamespace(ui=mock_ui, time=fake_time)
+
+
+@pytest.fixture(scope="module")
+def manager(_db_template):
+    """Provides one StreamManager per module; its only state is the stub db."""
+    return StreamManager(database=_db_template)
 
 
 class TestStreamManager:
     """Test StreamManager functionality with mocked dependencies."""
 
-    @patch("src.streamwatch.stream_manager.ui")
-    def test_add_streams_success(self, mock_ui, manager, mock_db):
+    def test_add_streams_success(self, patched, manager, mock_db):
         """Test successful stream addition delegation."""
-        mock_ui.prompt_add_streams.return_value = [
+        patched.ui.prompt_add_streams.return_value = [
             {"url": "https://twitch.tv/test", "alias": "Test"}
         ]
 
@@ -35,51 +115,86 @@ class TestStreamManager:
 
         assert success is True
         assert "Successfully added 1 new stream(s)" in message
-        mock_ui.prompt_add_streams.assert_called_once()
-        mock_db.save_stream.assert_called_once()
-
-    @patch("src.streamwatch.stream_manager.ui")
-    def test_add_streams_cancelled(self, mock_ui, manager):
-        """Test cancelled stream addition."""
-        mock_ui.prompt_add_streams.return_value = []
-
-        success, message = manager.add_streams()
+        patched.ui.prompt_add_streams.assert_called_once()
+        assert len(mock_db.calls_to("save_stream")) == 1
+
+    @pytest.mark.parametrize(
+        "method, ui_method, ui_return, expected",
+        [
+            ("add_streams", "prompt_add_streams", [], "cancelled"),
+            ("remove_streams", "prompt_remove_streams_dialog", None, "cancelled"),
+            ("remove_streams", "prompt_remove_streams_dialog", [], "No valid streams"),
+            ("import_streams", "prompt_for_filepath", "", "Import cancelled"),
+            ("export_streams", "prompt_for_filepath", "", "Export cancelled"),
+        ],
+        ids=["add", "remove", "remove-empty", "import", "export"],
+    )
+    def test_cancel_paths(
+        self, patched, manager, mock_db, method, ui_method, ui_return, expected
+    ):
+        """Test that declining a prompt leaves the database unchanged."""
+        getattr(patched.ui, ui_method).return_value = ui_return
+
+        success, message = getattr(manager, method)()
 
         assert success is False
-        assert "cancelled" in message
+        assert expected in message
+        assert not mock_db.calls_to("save_stream")
+        assert not mock_db.calls_to("delete_stream")
 
-    @patch("src.streamwatch.stream_manager.ui")
-    def test_remove_streams_success(self, mock_ui, manager, mock_db):
+    def test_remove_streams_success(self, patched, manager, db_with_streams):
         """Test successful stream removal delegation."""
-        mock_stream = StreamInfo(url="https://twitch.tv/test", alias="Test")
-        mock_db.load_streams.return_value = [mock_stream]
-        mock_db.delete_stream.return_value = True
-        mock_ui.prompt_remove_streams_dialog.return_value = [0]
+        patched.ui.prompt_remove_streams_dialog.return_value = [0]
 
         success, message = manager.remove_streams()
 
         assert success is True
         assert "Successfully removed 1 stream(s)" in message
-        mock_db.load_streams.assert_called_once()
-        mock_db.delete_stream.assert_called_with("https://twitch.tv/test")
+        assert db_with_streams.calls == [
+            ("load_streams",),
+            ("delete_stream", _TEST_STREAM.url),
+        ]
 
-    @patch("src.streamwatch.stream_manager.ui")
-    def test_list_streams(self, mock_ui, manager, mock_db):
+    def test_list_streams(self, patched, manager, mock_db):
         """Test listing streams delegation."""
-        mock_db.load_streams.return_value = []
-
         manager.list_streams()
 
-        mock_db.load_streams.assert_called_once()
-        mock_ui.display_stream_list.assert_called_once()
+        assert mock_db.calls == [("load_streams",)]
+        patched.ui.display_stream_list.assert_called_once()
 
-    def test_load_streams(self, manager, mock_db):
-        """Test loading streams from the database."""
-        mock_stream = StreamInfo(url="https://twitch.tv/test", alias="Test")
-        mock_db.load_streams.return_value = [mock_stream]
+    def test_import_streams_from_txt_valid(self, patched, manager, mock_db, import_txt):
+        """Test importing URLs from a file, skipping comments and blank lines."""
+        patched.ui.prompt_for_filepath.return_value = str(import_txt)
+
+        success, message = manager.import_streams()
 
+        assert success is True
+        assert "Successfully imported 2 stream(s)" in message
+        saved_urls = [stream.url for (stream,) in mock_db.calls_to("save_stream")]
+        assert saved_urls == [
+            "https://www.twitch.tv/import_one",
+            "https://www.youtube.com/@importtwo",
+        ]
+
+    def test_load_streams(self, manager, db_with_streams):
+        """Test loading streams from the database."""
         result = manager.load_streams()
 
         assert len(result) == 1
         assert result[0]["alias"] == "Test"
-        mock_db.load_streams.assert_called_once()
+        assert db_with_streams.calls == [("load_streams",)]
+
+    def test_export_streams_success(self, patched, manager, db_with_streams, tmp_path):
+        """Test exporting the database to the JSON file chosen by the user."""
+        destination = tmp_path / "export.json"
+        patched.ui.prompt_for_filepath.return_value = str(destination)
+
+        success, message = manager.export_streams()
+
+        assert success is True
+        assert "Successfully exported 1 streams" in message
+        assert json.loads(destination.read_text(encoding="utf-8")) == [
+            _TEST_STREAM.model_dump(mode="json")
+        ]
+        default = patched.ui.prompt_for_filepath.call_args.kwargs["default_filename"]
+        assert default == f"~/streamwatch_export_{_EXPORT_DATE}.json"
@@ -1,15 +1,55 @@
+from types import MappingProxyType
+
 import pytest
 
-from src.streamwatch.stream_utils import parse_url_metadata
+# Keep the URL parsing modules on one xdist worker under --dist loadgroup so
+# they share that worker's session-scoped parsed_urls cache.
+pytestmark = pytest.mark.xdist_group("url_parse")
+
+# Read-only expected results; cases that share a shape share the object.
+_UNKNOWN = MappingProxyType(
+    {"platform": "Unknown", "username": "unknown_stream", "type": "parse_error"}
+)
+
+# (id, url, expected) triples, built once at import.
+_URL_CASES = (
+    (
+        "twitch_valid",
+        "https://www.twitch.tv/some_streamer",
+        MappingProxyType(
+            {"platform": "Twitch", "username": "some_streamer", "type": "channel"}
+        ),
+    ),
+    (
+        "youtube_handle",
+        "https://www.youtube.com/@testchannel",
+        MappingProxyType(
+            {"platform": "YouTube", "username": "testchannel", "type": "channel"}
+        ),
+    ),
+    (
+        "youtube_watch",
+        "https://www.youtube.com/watch?v=abc",
+        MappingProxyType(
+            {
+                "platform": "YouTube",
+                "username": "unknown_youtube_url",
+                "type": "parse_error",
+            }
+        ),
+    ),
+    ("not_a_url_string", "not_a_url", _UNKNOWN),
+    ("ftp_protocol", "ftp://twitch.tv/some_streamer", _UNKNOWN),
+    ("empty_string", "", _UNKNOWN),
+    ("none", None, _UNKNOWN),
+)
 
 
 class TestUrlParsing:
-    def test_parse_twitch_url(self):
-        result = parse_url_metadata("https://www.twitch.tv/some_streamer")
-        assert result["platform"] == "Twitch"
-        assert result["username"] == "some_streamer"
-
-    def test_parse_youtube_url(self):
-        result = parse_url_metadata("https://www.youtube.com/@testchannel")
-        assert result["platform"] == "YouTube"
-        assert result["username"] == "testchannel"
+    @pytest.mark.parametrize(
+        "url, expected",
+        [(url, expected) for _, url, expected in _URL_CASES],
+        ids=[case_id for case_id, _, _ in _URL_CASES],
+    )
+    def test_parse_url_metadata(self, parsed_urls, url, expected):
+        assert parsed_urls[url] == expected
@@ -4,54 +4,44 @@ import pytest
 
 from src.streamwatch.stream_utils import parse_url_metadata, parse_url_metadata_typed
 
+pytestmark = pytest.mark.xdist_group("url_parse")
+
 
 class TestParseUrlMetadataExtended:
     """Extended tests for URL parsing functionality."""
 
-    def test_parse_twitch_url(self):
+    def test_parse_twitch_url(self, parsed_urls):
         """Test parsing Twitch URL."""
-        result = parse_url_metadata("https://twitch.tv/testuser")
+        result = parsed_urls["https://twitch.tv/testuser"]
         assert result["platform"] == "Twitch"
         assert result["username"] == "testuser"
 
-    def test_parse_kick_url(self):
+    def test_parse_kick_url(self, parsed_urls):
         """Test parsing Kick URL."""
-        result = parse_url_metadata("https://kick.com/testuser")
+        result = parsed_urls["https://kick.com/testuser"]
         assert result["platform"] == "Kick"
         assert result["username"] == "testuser"
 
-    def test_parse_invalid_url(self):
-        """Test parsing invalid URL."""
-        result = parse_url_metadata("not_a_url")
-        assert result["platform"] == "Unknown"
-        assert result["username"] == "unknown_stream"
-
-    def test_parse_empty_url(self):
-        """Test parsing empty URL."""
-        result = parse_url_metadata("")
-        assert result["platform"] == "Unknown"
-        assert result["username"] == "unknown_stream"
-
-    def test_parse_none_url(self):
-        """Test parsing None URL."""
-        result = parse_url_metadata(None)
-        assert result["platform"] == "Unknown"
-        assert result["username"] == "unknown_stream"
-
-    def test_parse_generic_url(self):
+    def test_parse_url_metadata_case_insensitive(self, parsed_urls):
+        """Test that the host is matched regardless of case."""
+        expected = parsed_urls["https://twitch.tv/testuser"]
+        assert parse_url_metadata("https://WWW.TWITCH.TV/testuser") == expected
+
+    def test_parse_generic_url(self, parsed_urls):
         """Test parsing generic URL."""
-        result = parse_url_metadata("https://example.com/stream")
+        result = parsed_urls["https://example.com/stream"]
         assert result["platform"] == "example"  # Fixed expectation
         assert result["username"] == "stream"
 
-    def test_parse_url_metadata_typed_youtube(self):
-        """Test typed URL parsing for YouTube."""
-        result = parse_url_metadata_typed("https://youtube.com/@testchannel")
-        assert result.platform == "Youtube"  # Fixed expectation
-        assert result.username == "testchannel"
-
-    def test_parse_url_metadata_typed_invalid(self):
-        """Test typed URL parsing for invalid URL."""
-        result = parse_url_metadata_typed("invalid")
-        assert result.platform == "Unknown"
-        assert result.username == "unknown_stream"
+    @pytest.mark.parametrize(
+        "url, platform, username",
+        [
+            ("https://youtube.com/@testchannel", "Youtube", "testchannel"),
+            ("invalid", "Unknown", "unknown_stream"),
+        ],
+        ids=["youtube", "invalid"],
+    )
+    def test_parse_url_metadata_typed(self, url, platform, username):
+        """Test typed URL parsing."""
+        result = parse_url_metadata_typed(url)
+        assert (result.platform, result.username) == (platform, username)
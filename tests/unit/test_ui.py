@@ -1,46 +1,217 @@
 """Unit tests for UI components module."""
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 import pytest
 
 from src.streamwatch.ui import display, input_handler
 
+_FILE_PATH = "/path/to/file.txt"
+
 # We now test display and input_handler separately
 
 
 class TestDisplayFunctions:
     """Test screen management and display functionality."""
 
-    @patch("src.streamwatch.ui.display.subprocess.run")
-    def test_clear_screen(self, mock_run):
-        """Test screen clearing."""
+    # Bound once so the parametrized cases skip the module attribute lookup.
+    _format_viewer_count = staticmethod(display.format_viewer_count)
+
+    @pytest.mark.parametrize(
+        "os_name, expected_command",
+        [("nt", ["cls"]), ("posix", ["clear"])],
+    )
+    def test_clear_screen(self, monkeypatch, os_name, expected_command):
+        """Test that screen clearing runs the platform's clear command."""
+        commands = []
+        fake_subprocess = SimpleNamespace(
+            run=lambda command, **kwargs: commands.append(command)
+        )
+        monkeypatch.setattr(display, "subprocess", fake_subprocess)
+        monkeypatch.setattr(display, "os", SimpleNamespace(name=os_name))
+
         display.clear_screen()
-        mock_run.assert_called_once()
+        assert commands == [expected_command]
+
+    def test_clear_screen_error_handling(self, monkeypatch):
+        """Test that a failing clear command is ignored."""
+
+        def failing_run(command, **kwargs):
+            raise OSError("clear not available")
 
-    def test_format_viewer_count(self):
+        monkeypatch.setattr(display, "subprocess", SimpleNamespace(run=failing_run))
+
+        display.clear_screen()
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, ""),
+            (123, "123"),
+            (1234, "1.2K"),
+            (1234567, "1.2M"),
+            ("invalid", ""),
+        ],
+    )
+    def test_format_viewer_count(self, value, expected):
         """Test viewer count formatting."""
-        assert display.format_viewer_count(123) == "123"
-        assert display.format_viewer_count(1234) == "1.2K"
-        assert display.format_viewer_count(1234567) == "1.2M"
-        assert display.format_viewer_count(None) == ""
+        assert self._format_viewer_count(value) == expected
+
+
+@pytest.mark.render
+class TestStreamFormatting:
+    """Test formatting of stream entries for lists and dialogs."""
+
+    @pytest.mark.parametrize(
+        "stream_info, index, expected",
+        [
+            (
+                {
+                    "alias": "Test User 1",
+                    "platform": "Twitch",
+                    "username": "testuser1",
+                    "title": "Test Stream 1",
+                    "viewer_count": 1234,
+                },
+                0,
+                "[1] Test User 1 (Twitch) │ 👁️ 1.2K - Test Stream 1",
+            ),
+            ("https://twitch.tv/raw", 1, "[2] https://twitch.tv/raw"),
+            (42, None, "Invalid stream data"),
+        ],
+        ids=["stream-dict", "raw-string", "invalid-type"],
+    )
+    def test_format_stream_for_display(self, stream_info, index, expected):
+        """Test the plain-text rendering used by prompt_toolkit dialogs."""
+        result = display.format_stream_for_display(
+            stream_info, index=index, for_prompt_toolkit=True
+        )
+        assert result == expected
+
+
+@pytest.mark.render
+class TestMessageDisplay:
+    """Test transient message display without real delays."""
+
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch):
+        """Replace the display module's ``time`` so no test waits for real."""
+        durations = []
+        monkeypatch.setattr(display, "time", SimpleNamespace(sleep=durations.append))
+        return durations
+
+    @pytest.mark.parametrize(
+        "kwargs, expected_sleeps",
+        [({}, [1.5]), ({"style": "error"}, [1.5]), ({"duration": 0}, [])],
+        ids=["basic", "with-style", "no-duration"],
+    )
+    def test_show_message(self, sleeps, kwargs, expected_sleeps):
+        """Test that the message pauses for its duration only when positive."""
+        display.show_message("Test message", **kwargs)
+        assert sleeps == expected_sleeps
+
+    def test_show_message_pause_after(self, monkeypatch, sleeps):
+        """Test that pause_after waits for Enter and tolerates cancellation."""
+        prompts = []
+
+        def fake_prompt(text, **kwargs):
+            prompts.append(text)
+            raise EOFError
+
+        monkeypatch.setattr(display, "prompt", fake_prompt)
+
+        display.show_message("Test message", duration=0, pause_after=True)
+        assert len(prompts) == 1
 
 
 class TestInputFunctions:
     """Test user input and prompting functionality."""
 
-    @patch("src.streamwatch.ui.input_handler.prompt")
-    def test_prompt_for_filepath_success(self, mock_prompt):
-        """Test successful file path prompting."""
-        mock_prompt.return_value = "/path/to/file.txt"
+    @pytest.mark.parametrize(
+        "prompt_outcome, expected",
+        [
+            (_FILE_PATH, _FILE_PATH),
+            ("", None),
+            (EOFError, None),
+            (KeyboardInterrupt, None),
+        ],
+        ids=["success", "empty", "eof", "interrupt"],
+    )
+    def test_prompt_for_filepath(self, monkeypatch, prompt_outcome, expected):
+        """Test file path prompting, including the cancel paths."""
+
+        def fake_prompt(*args, **kwargs):
+            if isinstance(prompt_outcome, type):
+                raise prompt_outcome
+            return prompt_outcome
+
+        monkeypatch.setattr(input_handler, "prompt", fake_prompt)
         result = input_handler.prompt_for_filepath("Enter file path: ")
-        assert result == "/path/to/file.txt"
+        assert result == expected
 
-    @patch("src.streamwatch.ui.input_handler.radiolist_dialog")
-    def test_select_stream_dialog_success(self, mock_dialog):
+    def test_select_stream_dialog_success(self, monkeypatch, mock_live_stream_info):
         """Test successful stream selection."""
-        mock_stream = {"url": "test_url", "alias": "Test"}
-        mock_dialog.return_value.run.return_value = mock_stream
+        selected = mock_live_stream_info[1]
+        monkeypatch.setattr(
+            input_handler,
+            "radiolist_dialog",
+            lambda **kwargs: SimpleNamespace(run=lambda: selected),
+        )
+
+        result = input_handler.select_stream_dialog(mock_live_stream_info)
+        assert result == selected
+
+    def test_select_stream_dialog_empty(self, monkeypatch):
+        """Test that an empty list shows a notice instead of the dialog."""
+        shown = []
+        monkeypatch.setattr(
+            input_handler,
+            "message_dialog",
+            lambda **kwargs: SimpleNamespace(run=lambda: shown.append(kwargs["title"])),
+        )
+
+        assert input_handler.select_stream_dialog([]) is None
+        assert shown == ["No Streams"]
+
+
+class TestStreamAddition:
+    """Test parsing of the add-streams prompt."""
+
+    @pytest.mark.parametrize(
+        "answer, expected",
+        [
+            (
+                "https://twitch.tv/a Alias One, https://youtube.com/@b,",
+                [
+                    {"url": "https://twitch.tv/a", "alias": "Alias One"},
+                    {"url": "https://youtube.com/@b", "alias": ""},
+                ],
+            ),
+            ("", []),
+        ],
+        ids=["urls-with-alias", "empty"],
+    )
+    def test_prompt_add_streams(self, monkeypatch, answer, expected):
+        """Test that comma-separated entries split into URL and alias."""
+        monkeypatch.setattr(input_handler, "clear_screen", lambda: None)
+        monkeypatch.setattr(input_handler, "prompt", lambda text, **kwargs: answer)
+
+        assert input_handler.prompt_add_streams() == expected
+
+
+class TestMenuActions:
+    """Test main menu input handling."""
+
+    def test_prompt_main_menu_action(self, monkeypatch):
+        """Test normalisation, rejection of unknown commands and Ctrl+D."""
+
+        def answers():
+            yield from (" A ", "3", "", "rm -rf")
+            raise EOFError
+
+        # Each call consumes the next answer; the last one simulates Ctrl+D.
+        feed = answers()
+        monkeypatch.setattr("builtins.input", lambda text: next(feed))
 
-        result = input_handler.select_stream_dialog([mock_stream])
-        assert result == mock_stream
+        results = [input_handler.prompt_main_menu_action() for _ in range(5)]
+        assert results == ["a", "3", "", "", "q"]